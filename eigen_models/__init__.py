@@ -5,8 +5,8 @@ from .core.profiles import Profile
 from .core.github_repositories import GitHubRepository
 from .core.interactions import UserInteraction, UserFollow
 from .core.sync_status import EmbeddingSyncStatus
-from .core.chat import Chat
-from .core.messages import Message
+from .core.chat import Chat, ChatType
+from .core.messages import Message, MessageType
 from .core.notifications import Notification, NotificationType
 from .core.push_tokens import PushToken
 from .core.cofounder_profiles import (
@@ -35,7 +35,9 @@ __all__ = [
     "UserFollow",
     "EmbeddingSyncStatus",
     "Chat",
+    "ChatType",
     "Message",
+    "MessageType",
     "Notification",
     "NotificationType",
     "PushToken",
@@ -5,9 +5,10 @@ This module provides the foundational SQLAlchemy declarative base and common fun
 shared across all database models in the Eigen platform.
 """
 
-import datetime
-from sqlalchemy import Column, Integer, DateTime, MetaData
+from sqlalchemy import Column, Integer, DateTime, Enum, MetaData, select
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql.expression import FunctionElement
 
 # Define naming conventions for constraints to ensure consistency
 convention = {
@@ -21,8 +22,243 @@ convention = {
 # Create metadata with naming convention
 metadata = MetaData(naming_convention=convention)
 
+
+def to_iso(value):
+    """
+    ISO-8601 string for a datetime, or None.
+
+    ``to_dict`` implementations pass the attribute through this helper rather
+    than repeating it in an inline conditional, so each instrumented attribute
+    is read once instead of twice.
+    """
+    return value.isoformat() if value is not None else None
+
+
+# Value conversions applied by ModelMixin.to_dict
+_RAW, _ISO, _ENUM = 0, 1, 2
+
+
+class ModelMixin:
+    """
+    Read helpers shared by every model through ``Base``.
+    """
+
+    # Attribute names serialized by the generic to_dict(), in output order.
+    # Models that hand-write to_dict() leave this empty.
+    __to_dict_fields__ = ()
+
+    @classmethod
+    def _to_dict_spec(cls) -> tuple:
+        """
+        ``(name, conversion)`` pairs for ``__to_dict_fields__``.
+
+        Conversions are derived from the mapped column types on first use and
+        cached on the class, so ``to_dict`` never inspects types per call.
+        """
+        spec = cls.__dict__.get("_to_dict_spec_cache")
+        if spec is None:
+            columns = cls.__mapper__.columns
+            entries = []
+            for name in cls.__to_dict_fields__:
+                column_type = columns[name].type
+                if isinstance(column_type, DateTime):
+                    kind = _ISO
+                elif isinstance(column_type, Enum) and column_type.enum_class:
+                    kind = _ENUM
+                else:
+                    kind = _RAW
+                entries.append((name, kind))
+            spec = tuple(entries)
+            type.__setattr__(cls, "_to_dict_spec_cache", spec)
+        return spec
+
+    @classmethod
+    def _compile_to_dict(cls):
+        """
+        Generate a straight-line ``to_dict`` for ``__to_dict_fields__``.
+
+        The generated function indexes the instance ``__dict__`` once per field
+        and builds the result in a single dict display, with no loop and no
+        per-field conversion dispatch. If any field is not loaded it defers to
+        ``_to_dict_slow``, which goes through the attribute descriptors.
+
+        A twin taking any mapping (such as a Core ``RowMapping``) is generated
+        from the same body and installed as ``_dict_from_row``.
+        """
+        body = []
+        items = []
+        for i, (name, kind) in enumerate(cls._to_dict_spec()):
+            if kind == _RAW:
+                items.append(f"{name!r}: d[{name!r}]")
+                continue
+            body.append(f"        v{i} = d[{name!r}]")
+            convert = "isoformat()" if kind == _ISO else "value"
+            items.append(f"{name!r}: v{i}.{convert} if v{i} is not None else None")
+        source = "\n".join([
+            "def to_dict(self):",
+            "    d = self.__dict__",
+            "    try:",
+            *body,
+            "        return {" + ", ".join(items) + "}",
+            "    except KeyError:",
+            "        return self._to_dict_slow()",
+            "",
+            "def from_row(d):",
+            *[line[4:] for line in body],
+            "    return {" + ", ".join(items) + "}",
+        ])
+        namespace = {}
+        exec(compile(source, f"<{cls.__name__}.to_dict>", "exec"), namespace)
+        to_dict = namespace["to_dict"]
+        to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+        to_dict.__doc__ = ModelMixin.to_dict.__doc__
+        type.__setattr__(cls, "_dict_from_row", staticmethod(namespace["from_row"]))
+        return to_dict
+
+    def _to_dict_slow(self) -> dict:
+        result = {}
+        for name, kind in self._to_dict_spec():
+            value = getattr(self, name)
+            if kind and value is not None:
+                value = value.isoformat() if kind == _ISO else value.value
+            result[name] = value
+        return result
+
+    def to_dict(self) -> dict:
+        """
+        Convert the model to a dictionary for API responses.
+
+        Loaded values are read straight from the instance ``__dict__``,
+        skipping the instrumented attribute descriptors; if anything is not
+        loaded yet (expired or deferred) the whole dict is built through normal
+        attribute access instead. Datetimes are rendered as ISO-8601 strings
+        and enums as their values.
+
+        The first call on a model class replaces this method with a generated
+        one specialised to the class's ``__to_dict_fields__``.
+        """
+        to_dict = type(self)._install_to_dict()
+        return to_dict(self)
+
+    @classmethod
+    def _install_to_dict(cls):
+        to_dict = cls._compile_to_dict()
+        type.__setattr__(cls, "to_dict", to_dict)
+        return to_dict
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the model straight to JSON bytes with orjson.
+
+        Produces the same document as ``to_dict()`` run through a JSON encoder.
+        For models driven by ``__to_dict_fields__`` the raw datetimes and enums
+        are handed to orjson, which formats them natively instead of calling
+        ``isoformat()`` per field. Requires the ``orjson`` extra.
+        """
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "to_json_bytes() requires orjson; install eigen-models[orjson]"
+            ) from e
+        fields = self.__to_dict_fields__
+        if not fields:
+            return orjson.dumps(self.to_dict())
+        loaded = self.__dict__
+        return orjson.dumps({
+            name: loaded[name] if name in loaded else getattr(self, name)
+            for name in fields
+        })
+
+    @classmethod
+    def list_as_dicts(cls, session, ids) -> list:
+        """
+        Fetch rows by primary key as plain dicts, bypassing ORM hydration.
+
+        Intended for read-only list endpoints: rows come straight from a Core
+        ``SELECT`` of the table, so no identity-map or attribute-history
+        bookkeeping is done per row. Keys are column names and values are left
+        as the driver returns them (datetimes are not stringified; a JSON
+        encoder such as orjson serializes them natively). Result order is not
+        guaranteed to follow ``ids``.
+
+        Args:
+            session: Active SQLAlchemy session
+            ids: Primary key values to fetch
+
+        Returns:
+            List of dictionaries, one per matching row
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        table = cls.__table__
+        pk = table.primary_key.columns[0]
+        result = session.execute(select(table).where(pk.in_(ids)))
+        return [dict(row) for row in result.mappings()]
+
+    @classmethod
+    def iter_dicts(cls, session, **filters):
+        """
+        Yield rows matching ``filters`` as dicts without building ORM objects.
+
+        Runs ``select(table).filter_by(**filters)`` against the Core table, so
+        no instances, identity-map entries or attribute state are created.
+        For models with ``__to_dict_fields__`` each row is passed through the
+        generated serializer and comes out exactly like ``to_dict()``; other
+        models yield every column with driver values, as ``list_as_dicts`` does.
+
+        Args:
+            session: Active SQLAlchemy session
+            **filters: Column equality filters, e.g. ``user_id=...``
+
+        Yields:
+            One dictionary per matching row
+        """
+        result = session.execute(select(cls.__table__).filter_by(**filters))
+        if not cls.__to_dict_fields__:
+            for row in result.mappings():
+                yield dict(row)
+            return
+        if "_dict_from_row" not in cls.__dict__:
+            cls._install_to_dict()
+        from_row = cls._dict_from_row
+        for row in result.mappings():
+            yield from_row(row)
+
+
 # Create the declarative base that all models will inherit from
-Base = declarative_base(metadata=metadata)
+Base = declarative_base(metadata=metadata, cls=ModelMixin)
+
+
+class utcnow(FunctionElement):
+    """
+    Current UTC time, evaluated by the database.
+
+    Timestamp columns are naive ``DateTime`` holding UTC, so PostgreSQL's
+    session-local ``now()`` is converted explicitly. Use as
+    ``server_default=utcnow()`` / ``onupdate=utcnow()`` so inserts and
+    updates don't bind a Python-side timestamp per row.
+
+    SQLAlchemy only fetches server-generated values back after an INSERT,
+    so models with an ``onupdate=utcnow()`` column set
+    ``__mapper_args__ = {"eager_defaults": True}``. Otherwise the column is
+    expired after every UPDATE, which costs a reload on next access (or a
+    DetachedInstanceError once the session is closed).
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
 
 
 class BaseModel(Base):
@@ -40,18 +276,19 @@ class BaseModel(Base):
     """
     
     __abstract__ = True
+    __mapper_args__ = {"eager_defaults": True}
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     created_at = Column(
         DateTime, 
-        default=datetime.datetime.utcnow, 
+        server_default=utcnow(), 
         nullable=False,
         comment="Timestamp when the record was created"
     )
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
         comment="Timestamp when the record was last updated"
     )
@@ -74,6 +311,6 @@ class BaseModel(Base):
         """
         return {
             "id": self.id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": to_iso(self.created_at),
+            "updated_at": to_iso(self.updated_at),
         }
\ No newline at end of file
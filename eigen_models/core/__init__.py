@@ -4,8 +4,8 @@ from .profiles import Profile
 from .github_repositories import GitHubRepository
 from .interactions import UserInteraction, UserFollow
 from .sync_status import EmbeddingSyncStatus
-from .chat import Chat
-from .messages import Message
+from .chat import Chat, ChatType
+from .messages import Message, MessageType
 from .notifications import Notification, NotificationType
 from .push_tokens import PushToken
 from .cofounder_profiles import (
@@ -29,7 +29,9 @@ __all__ = [
     "UserFollow",
     "EmbeddingSyncStatus",
     "Chat",
+    "ChatType",
     "Message",
+    "MessageType",
     "Notification",
     "NotificationType",
     "PushToken",
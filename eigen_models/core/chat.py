@@ -5,7 +5,6 @@ This module contains models for chat conversations between users,
 supporting both one-on-one and group chats.
 """
 
-import datetime
 from sqlalchemy import (
     Column,
     DateTime,
@@ -14,15 +13,21 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
-    CheckConstraint,
+    Enum as SQLEnum,
 )
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
+from enum import Enum
 
-from ..base import Base
+from ..base import Base, to_iso, utcnow
 from .users import User
 
 
+class ChatType(str, Enum):
+    DIRECT = "direct"
+    GROUP = "group"
+
+
 class Chat(Base):
     """
     Chat model representing conversations between users.
@@ -46,13 +51,13 @@ class Chat(Base):
     id = Column(
         Integer,
         primary_key=True,
-        index=True,
         comment="Primary key for chat"
     )
     
     # Chat type and metadata
+    # Stored by value so existing 'direct'/'group' rows map onto the type as-is
     chat_type = Column(
-        String(20),
+        SQLEnum(ChatType, values_callable=lambda e: [m.value for m in e]),
         nullable=False,
         comment="Chat type: 'direct' (1-on-1) or 'group'"
     )
@@ -83,17 +88,19 @@ class Chat(Base):
     # Timestamps
     created_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
+        server_default=utcnow(),
         nullable=False,
         comment="When the chat was created"
     )
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
         comment="When the chat was last modified"
     )
+    # Kept current by the trg_message_bump_chat trigger on messages (created
+    # by migration, not create_all); the application need not write it
     last_message_at = Column(
         DateTime,
         nullable=True,
@@ -101,20 +108,23 @@ class Chat(Base):
     )
     
     # Relationships
-    creator = relationship("User", foreign_keys=[created_by], backref="created_chats")
-    messages = relationship("Message", back_populates="chat", cascade="all, delete-orphan")
+    creator = relationship("User", foreign_keys=[created_by], back_populates="created_chats")
+    # messages.chat_id is ON DELETE CASCADE; let the database remove them
+    # instead of loading every message before deleting a chat
+    messages = relationship(
+        "Message",
+        back_populates="chat",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
     
     # Table constraints and indexes
     __table_args__ = (
-        CheckConstraint(
-            "chat_type IN ('direct', 'group')",
-            name="ck_chat_type"
-        ),
         Index("idx_chat_type", "chat_type"),
-        Index("idx_chat_created_by", "created_by"),
         Index("idx_chat_last_message_at", "last_message_at"),
         {"comment": "Chat conversations between users"},
     )
+    __mapper_args__ = {"eager_defaults": True}
     
     def __repr__(self) -> str:
         return f"<Chat(id={self.id}, chat_type='{self.chat_type}', name='{self.name}')>"
@@ -123,12 +133,12 @@ class Chat(Base):
         """Convert chat to dictionary for API responses."""
         return {
             "id": self.id,
-            "chat_type": self.chat_type,
+            "chat_type": ChatType(self.chat_type).value if self.chat_type else None,
             "name": self.name,
             "created_by": self.created_by,
             "participant_ids": self.participant_ids if self.participant_ids else [],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "last_message_at": self.last_message_at.isoformat() if self.last_message_at else None,
+            "created_at": to_iso(self.created_at),
+            "updated_at": to_iso(self.updated_at),
+            "last_message_at": to_iso(self.last_message_at),
         }
 
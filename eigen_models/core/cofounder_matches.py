@@ -2,7 +2,6 @@
 Cofounder match model for the Eigen platform.
 """
 
-import datetime
 from sqlalchemy import (
     Column,
     DateTime,
@@ -14,11 +13,12 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     Enum as SQLEnum,
+    text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
 from enum import Enum
 
-from ..base import Base
+from ..base import Base, to_iso, utcnow
 
 
 class MatchStatus(str, Enum):
@@ -31,12 +31,11 @@ class MatchStatus(str, Enum):
 class CofounderMatch(Base):
     __tablename__ = "cofounder_matches"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     sender_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     receiver_id = Column(
         String(255),
@@ -48,28 +47,58 @@ class CofounderMatch(Base):
         SQLEnum(MatchStatus),
         default=MatchStatus.PENDING,
         nullable=False,
-        index=True,
     )
     message = Column(Text, nullable=True)
     compatibility_score = Column(Float, nullable=True)
     responded_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
-    sender = relationship("User", back_populates="sent_matches", foreign_keys=[sender_id])
-    receiver = relationship("User", back_populates="received_matches", foreign_keys=[receiver_id])
+    sender = relationship(
+        "User",
+        back_populates="sent_matches",
+        foreign_keys=[sender_id],
+    )
+    receiver = relationship(
+        "User",
+        back_populates="received_matches",
+        foreign_keys=[receiver_id],
+    )
 
     __table_args__ = (
         UniqueConstraint("sender_id", "receiver_id", name="uq_cofounder_match"),
-        Index("idx_match_sender_status", "sender_id", "status"),
-        Index("idx_match_receiver_status", "receiver_id", "status"),
+        # Inbox and outbox lookups only ask for pending requests; keep terminal
+        # rows out. Unfiltered per-user listings use the sender/receiver indexes
+        Index(
+            "idx_match_sender_pending",
+            "sender_id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        Index(
+            "idx_match_receiver_pending",
+            "receiver_id",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
         Index("idx_match_created_at", "created_at"),
     )
+    __mapper_args__ = {"eager_defaults": True}
+
+    @classmethod
+    def default_loading_options(cls) -> list:
+        """
+        Loader options for endpoints that list matches with both parties.
+
+        Apply as
+        ``select(CofounderMatch).options(*CofounderMatch.default_loading_options())``
+        so a page of matches loads senders and receivers with one ``IN`` query
+        each instead of lazy SELECTs per match.
+        """
+        return [selectinload(cls.sender), selectinload(cls.receiver)]
 
     def __repr__(self) -> str:
         return f"<CofounderMatch(id={self.id}, sender='{self.sender_id}', receiver='{self.receiver_id}', status='{self.status}')>"
@@ -82,7 +111,7 @@ class CofounderMatch(Base):
             "status": self.status.value if self.status else None,
             "message": self.message,
             "compatibility_score": self.compatibility_score,
-            "responded_at": self.responded_at.isoformat() if self.responded_at else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "responded_at": to_iso(self.responded_at),
+            "created_at": to_iso(self.created_at),
+            "updated_at": to_iso(self.updated_at),
         }
@@ -2,7 +2,6 @@
 Cofounder profile model for the Eigen platform.
 """
 
-import datetime
 from sqlalchemy import (
     Boolean,
     Column,
@@ -18,7 +17,7 @@ from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 from enum import Enum
 
-from ..base import Base
+from ..base import Base, to_iso, utcnow
 
 
 class TechnicalLevel(str, Enum):
@@ -60,7 +59,7 @@ class RemotePreference(str, Enum):
 class CofounderProfile(Base):
     __tablename__ = "cofounder_profiles"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
@@ -92,7 +91,7 @@ class CofounderProfile(Base):
 
     # Preferences
     looking_for_description = Column(Text, nullable=True)
-    preferences = Column(JSONB, nullable=True, default=dict)
+    preferences = Column(JSONB, nullable=True)
 
     # Meta
     is_complete = Column(Boolean, default=False, nullable=False)
@@ -100,21 +99,21 @@ class CofounderProfile(Base):
     is_visible = Column(Boolean, default=True, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
     user = relationship("User", back_populates="cofounder_profile")
 
     __table_args__ = (
-        Index("idx_cofounder_profile_user_id", "user_id"),
         Index("idx_cofounder_profile_visible", "is_visible"),
         Index("idx_cofounder_profile_complete", "is_complete"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self) -> str:
         return f"<CofounderProfile(id={self.id}, user_id='{self.user_id}')>"
@@ -203,6 +202,6 @@ class CofounderProfile(Base):
             "is_complete": self.is_complete,
             "completion_score": self.completion_score,
             "is_visible": self.is_visible,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": to_iso(self.created_at),
+            "updated_at": to_iso(self.updated_at),
         }
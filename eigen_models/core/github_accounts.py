@@ -5,13 +5,11 @@ This module contains models for GitHub account integration, storing GitHub user
 information and OAuth tokens for authenticated GitHub access.
 """
 
-import datetime
 from sqlalchemy import (
     BigInteger,
     Column,
     DateTime,
     ForeignKey,
-    Index,
     Integer,
     String,
     Text,
@@ -19,7 +17,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import relationship
 
-from ..base import Base
+from ..base import Base, to_iso, utcnow
 from .users import User
 
 
@@ -57,7 +55,6 @@ class GitHubAccount(Base):
     id = Column(
         Integer,
         primary_key=True,
-        index=True,
         comment="Primary key for GitHub account"
     )
     
@@ -97,7 +94,7 @@ class GitHubAccount(Base):
     # Sync tracking
     last_synced = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
+        server_default=utcnow(),
         nullable=False,
         comment="Timestamp of last sync with GitHub API"
     )
@@ -105,18 +102,16 @@ class GitHubAccount(Base):
     # Timestamps
     created_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
+        server_default=utcnow(),
         nullable=False,
         comment="When the GitHub account was linked"
     )
     
     # Relationship
-    user = relationship("User", backref="github_accounts")
+    user = relationship("User", back_populates="github_accounts")
     
     # Table constraints and indexes
     __table_args__ = (
-        Index("idx_github_account_user_id", "user_id"),
-        Index("idx_github_account_github_user_id", "github_user_id"),
         {"comment": "GitHub account integration for users"},
     )
     
@@ -134,7 +129,7 @@ class GitHubAccount(Base):
             "follower_count": self.follower_count,
             "following_count": self.following_count,
             "public_repos": self.public_repos,
-            "last_synced": self.last_synced.isoformat() if self.last_synced else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "last_synced": to_iso(self.last_synced),
+            "created_at": to_iso(self.created_at),
         }
 
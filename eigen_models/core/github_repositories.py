@@ -2,7 +2,6 @@
 GitHub repository models for the Eigen platform.
 """
 
-import datetime
 from sqlalchemy import (
     BigInteger,
     Boolean,
@@ -17,13 +16,13 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 
-from ..base import Base
+from ..base import Base, to_iso, utcnow
 
 
 class GitHubRepository(Base):
     __tablename__ = "github_repositories"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
@@ -55,22 +54,23 @@ class GitHubRepository(Base):
     dependencies = Column(JSONB, nullable=True)
     last_push_at = Column(DateTime, nullable=True)
     repo_created_at = Column(DateTime, nullable=True)
-    last_synced_at = Column(DateTime, default=datetime.datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    last_synced_at = Column(DateTime, server_default=utcnow())
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
-    user = relationship("User", backref="repositories")
+    user = relationship("User", back_populates="repositories")
 
+    # fillfactor=90 for HOT updates is set by migration; create_all omits it
     __table_args__ = (
-        Index("idx_github_repo_user_id", "user_id"),
         Index("idx_github_repo_languages", "languages", postgresql_using="gin"),
         Index("idx_github_repo_topics", "topics", postgresql_using="gin"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     def to_dict(self) -> dict:
         return {
@@ -90,6 +90,6 @@ class GitHubRepository(Base):
             "is_private": self.is_private,
             "llm_summary": self.llm_summary,
             "frameworks_detected": self.frameworks_detected or [],
-            "last_push_at": self.last_push_at.isoformat() if self.last_push_at else None,
-            "last_synced_at": self.last_synced_at.isoformat() if self.last_synced_at else None,
+            "last_push_at": to_iso(self.last_push_at),
+            "last_synced_at": to_iso(self.last_synced_at),
         }
@@ -2,26 +2,25 @@
 User interaction models for the Eigen platform.
 """
 
-import datetime
 from sqlalchemy import (
+    BigInteger,
     Column,
     DateTime,
     ForeignKey,
     Index,
-    Integer,
     String,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 
-from ..base import Base
+from ..base import Base, to_iso, utcnow
 
 
 class UserInteraction(Base):
     """User-to-user interactions like mute, block, etc."""
     __tablename__ = "user_interactions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, primary_key=True)
     user_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
@@ -34,14 +33,20 @@ class UserInteraction(Base):
     )
     interaction_type = Column(String(30), nullable=False)  # mute, block, report
     interaction_metadata = Column(JSONB, nullable=True)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     __table_args__ = (
         UniqueConstraint(
             "user_id", "target_user_id", "interaction_type", name="uq_user_interaction"
         ),
-        Index("idx_user_interaction_user", "user_id"),
-        Index("idx_user_interaction_target", "target_user_id"),
+        # uq_user_interaction already leads with user_id; the reverse lookup
+        # carries the rest of the key so it can be answered from the index
+        Index(
+            "idx_user_interaction_target_user",
+            "target_user_id",
+            "user_id",
+            "interaction_type",
+        ),
         Index("idx_user_interaction_type", "interaction_type"),
     )
 
@@ -52,14 +57,14 @@ class UserInteraction(Base):
             "target_user_id": self.target_user_id,
             "interaction_type": self.interaction_type,
             "interaction_metadata": self.interaction_metadata,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": to_iso(self.created_at),
         }
 
 
 class UserFollow(Base):
     __tablename__ = "user_follows"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, primary_key=True)
     follower_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
@@ -70,18 +75,38 @@ class UserFollow(Base):
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
         nullable=False,
     )
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     __table_args__ = (
         UniqueConstraint("follower_id", "following_id", name="uq_follow"),
-        Index("idx_follower", "follower_id"),
-        Index("idx_following", "following_id"),
+        # uq_follow serves follower_id lookups; "who follows X" lists read
+        # follower_id straight from this index
+        Index("idx_following_follower", "following_id", "follower_id"),
     )
 
+    @classmethod
+    def follow(cls, session, follower_id: str, following_id: str):
+        """
+        Idempotently record a follow in a single round trip.
+
+        Lets uq_follow arbitrate instead of a SELECT-then-INSERT, so
+        concurrent requests for the same pair cannot race.
+
+        Returns:
+            The id of the new follow, or None if it already existed
+        """
+        stmt = (
+            pg_insert(cls)
+            .values(follower_id=follower_id, following_id=following_id)
+            .on_conflict_do_nothing(index_elements=["follower_id", "following_id"])
+            .returning(cls.id)
+        )
+        return session.execute(stmt).scalar_one_or_none()
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
             "follower_id": self.follower_id,
             "following_id": self.following_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": to_iso(self.created_at),
         }
@@ -5,8 +5,8 @@ This module contains models for chat messages, storing message content,
 metadata, and read receipts for conversations.
 """
 
-import datetime
 from sqlalchemy import (
+    BigInteger,
     Column,
     DateTime,
     ForeignKey,
@@ -14,15 +14,23 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
-    CheckConstraint,
+    Enum as SQLEnum,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
+from enum import Enum
 
-from ..base import Base
+from ..base import Base, to_iso, utcnow
 from .users import User
 
 
+class MessageType(str, Enum):
+    TEXT = "text"
+    IMAGE = "image"
+    FILE = "file"
+    SYSTEM = "system"
+
+
 class Message(Base):
     """
     Message model representing individual messages in a chat conversation.
@@ -31,7 +39,7 @@ class Message(Base):
     and attachments for chat messages.
     
     Attributes:
-        id: Primary key integer field
+        id: Primary key bigint field
         chat_id: Foreign key to the chats table
         sender_id: Foreign key to the users table (message sender)
         content: Message content/text
@@ -45,9 +53,8 @@ class Message(Base):
     
     # Primary key
     id = Column(
-        Integer,
+        BigInteger,
         primary_key=True,
-        index=True,
         comment="Primary key for message"
     )
     
@@ -56,23 +63,22 @@ class Message(Base):
         Integer,
         ForeignKey("chats.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="Foreign key to chats table"
     )
     sender_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
         comment="Foreign key to users table (message sender)"
     )
     
     # Message content
     content = Column(Text, nullable=True, comment="Message content/text")
+    # Stored by value so existing lowercase rows map onto the type as-is
     message_type = Column(
-        String(20),
+        SQLEnum(MessageType, values_callable=lambda e: [m.value for m in e]),
         nullable=False,
-        default="text",
+        default=MessageType.TEXT,
         comment="Message type: 'text', 'image', 'file', 'system'"
     )
     
@@ -93,29 +99,47 @@ class Message(Base):
     # Timestamps
     created_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
+        server_default=utcnow(),
         nullable=False,
-        index=True,
         comment="When the message was created"
     )
     
     # Relationships
     chat = relationship("Chat", back_populates="messages")
-    sender = relationship("User", backref="messages")
+    sender = relationship("User", back_populates="messages")
     
     # Table constraints and indexes
     __table_args__ = (
-        CheckConstraint(
-            "message_type IN ('text', 'image', 'file', 'system')",
-            name="ck_message_type"
-        ),
-        Index("idx_message_chat_id", "chat_id"),
         Index("idx_message_sender_id", "sender_id"),
-        Index("idx_message_created_at", "created_at"),
-        Index("idx_message_chat_created_at", "chat_id", "created_at"),
+        # Append-only in created_at order; BRIN covers time-range scans
+        Index(
+            "idx_message_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Chat history, newest first; sender and type come from the index so
+        # listings that only need those skip the heap
+        Index(
+            "idx_message_chat_created_at",
+            "chat_id",
+            created_at.desc(),
+            postgresql_include=["sender_id", "message_type"],
+        ),
         {"comment": "Messages in chat conversations"},
     )
     
+    @classmethod
+    def default_loading_options(cls) -> list:
+        """
+        Loader options for endpoints that list messages with their senders.
+
+        Apply as ``select(Message).options(*Message.default_loading_options())``
+        so a page of messages loads its senders with one ``IN`` query instead
+        of one lazy SELECT per message.
+        """
+        return [selectinload(cls.sender)]
+
     def __repr__(self) -> str:
         return f"<Message(id={self.id}, chat_id={self.chat_id}, sender_id='{self.sender_id}', message_type='{self.message_type}')>"
     
@@ -126,9 +150,9 @@ class Message(Base):
             "chat_id": self.chat_id,
             "sender_id": self.sender_id,
             "content": self.content,
-            "message_type": self.message_type,
+            "message_type": MessageType(self.message_type).value if self.message_type else None,
             "attachments": self.attachments,
-            "read_at": self.read_at.isoformat() if self.read_at else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "read_at": to_iso(self.read_at),
+            "created_at": to_iso(self.created_at),
         }
 
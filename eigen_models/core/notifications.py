@@ -2,23 +2,68 @@
 Notification models for the Eigen platform.
 """
 
-import datetime
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
     ForeignKey,
     Index,
-    Integer,
     String,
     Text,
+    case,
+    func,
+    null,
+    text,
     Enum as SQLEnum,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
+from sqlalchemy.orm import deferred, relationship, selectinload
+from sqlalchemy.sql import operators
+from datetime import datetime, timezone
 from enum import Enum
 
-from ..base import Base
+from ..base import Base, to_iso, utcnow
+
+
+class _IsReadComparator(Comparator):
+    """
+    SQL side of ``Notification.is_read``.
+
+    Comparisons with a boolean render as ``read_at IS [NOT] NULL`` rather
+    than ``(read_at IS NOT NULL) = false``, so PostgreSQL can match unread
+    filters to the ``read_at IS NULL`` partial index.
+    """
+
+    def __init__(self, read_at):
+        super().__init__(read_at.isnot(None))
+        self.read_at = read_at
+
+    def operate(self, op, *other, **kwargs):
+        if op is operators.inv:
+            return self.read_at.is_(None)
+        if (
+            op in (operators.eq, operators.ne, operators.is_, operators.is_not)
+            and len(other) == 1
+            and isinstance(other[0], bool)
+        ):
+            read = other[0] is (op in (operators.eq, operators.is_))
+            return self.read_at.isnot(None) if read else self.read_at.is_(None)
+        return op(self.__clause_element__(), *other, **kwargs)
+
+    def _bulk_update_tuples(self, value):
+        # update(Notification).values(is_read=...) and Query.update() route
+        # through here (a hybrid with a custom comparator does not consult
+        # update_expression). Marking read keeps an existing read_at and
+        # otherwise stamps the database time; marking unread clears it
+        if isinstance(value, bool):
+            read_at = func.coalesce(self.read_at, utcnow()) if value else null()
+        else:
+            read_at = case(
+                (value, func.coalesce(self.read_at, utcnow())), else_=null()
+            )
+        return [(self.read_at, read_at)]
 
 
 class NotificationType(str, Enum):
@@ -33,38 +78,106 @@ class NotificationType(str, Enum):
 class Notification(Base):
     __tablename__ = "notifications"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, primary_key=True)
     recipient_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     actor_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
-    notification_type = Column(SQLEnum(NotificationType), nullable=False, index=True)
+    notification_type = Column(SQLEnum(NotificationType), nullable=False)
     title = Column(String(255), nullable=True)
     content = Column(Text, nullable=False)
     entity_type = Column(String(50), nullable=True)
     entity_id = Column(String(255), nullable=True)
-    extra_data = Column(JSONB, nullable=True, default=dict)
-    is_read = Column(Boolean, default=False, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False, index=True)
+    extra_data = Column(JSONB, nullable=True)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    # A notification is read once read_at is set; see is_read
     read_at = Column(DateTime, nullable=True)
+    # Superseded by read_at. Kept for one release so instances still on the
+    # old code can read and write it; the trg_notification_sync_is_read
+    # trigger (created by migration) keeps it equal to read_at IS NOT NULL.
+    # Not loaded or written by this code; a later revision drops it
+    _is_read_column = deferred(
+        Column("is_read", Boolean, server_default=text("false"), nullable=False)
+    )
 
-    recipient = relationship("User", foreign_keys=[recipient_id], backref="notifications_received")
-    actor = relationship("User", foreign_keys=[actor_id], backref="notifications_triggered")
+    recipient = relationship("User", foreign_keys=[recipient_id], back_populates="notifications_received")
+    actor = relationship(
+        "User",
+        foreign_keys=[actor_id],
+        back_populates="notifications_triggered",
+    )
 
     __table_args__ = (
-        Index("idx_notification_recipient_unread", "recipient_id", "is_read"),
-        Index("idx_notification_recipient_created", "recipient_id", "created_at"),
+        # Unread counts and badges only look at the unread minority
+        Index(
+            "idx_notification_recipient_unread",
+            "recipient_id",
+            postgresql_where=text("read_at IS NULL"),
+        ),
+        # Serves the old code's is_read filter; goes with the is_read column
+        Index(
+            "idx_notification_recipient_unread_legacy",
+            "recipient_id",
+            postgresql_where=text("is_read = false"),
+        ),
+        # Feed order, newest first; the included columns let per-type and
+        # read/unread summaries over a recipient's feed skip the heap
+        Index(
+            "idx_notification_recipient_created",
+            "recipient_id",
+            created_at.desc(),
+            postgresql_include=["notification_type", "read_at"],
+        ),
         Index("idx_notification_type_created", "notification_type", "created_at"),
+        # actor_id is only matched by equality (including ON DELETE SET NULL);
+        # a hash index stores 4-byte hash codes instead of the Clerk id strings
+        Index("idx_notification_actor_hash", "actor_id", postgresql_using="hash"),
+        # Rows arrive in created_at order, so a BRIN index serves time-range
+        # scans (retention, recent activity) at a fraction of a btree's size
+        Index(
+            "idx_notification_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
+    @hybrid_property
+    def is_read(self) -> bool:
+        """Whether the notification has been read, derived from ``read_at``."""
+        return self.read_at is not None
+
+    @is_read.inplace.setter
+    def _is_read_setter(self, value: bool) -> None:
+        # Marking read stamps the current UTC time; marking unread clears it
+        if not value:
+            self.read_at = None
+        elif self.read_at is None:
+            self.read_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    @is_read.inplace.comparator
+    @classmethod
+    def _is_read_comparator(cls):
+        return _IsReadComparator(cls.read_at)
+
+    @classmethod
+    def default_loading_options(cls) -> list:
+        """
+        Loader options for the notification feed.
+
+        Apply as
+        ``select(Notification).options(*Notification.default_loading_options())``
+        so a page of notifications loads who triggered each one with a single
+        ``IN`` query instead of one lazy SELECT per notification.
+        """
+        return [selectinload(cls.actor)]
+
     def __repr__(self) -> str:
         return f"<Notification(id={self.id}, type='{self.notification_type}', recipient='{self.recipient_id}')>"
 
@@ -78,8 +191,8 @@ class Notification(Base):
             "content": self.content,
             "entity_type": self.entity_type,
             "entity_id": self.entity_id,
-            "metadata": self.extra_data,
+            "metadata": self.extra_data or {},
             "is_read": self.is_read,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "read_at": self.read_at.isoformat() if self.read_at else None,
+            "created_at": to_iso(self.created_at),
+            "read_at": to_iso(self.read_at),
         }
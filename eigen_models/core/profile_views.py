@@ -2,23 +2,22 @@
 Profile view tracking model for the Eigen platform.
 """
 
-import datetime
 from sqlalchemy import (
+    BigInteger,
     Column,
     DateTime,
     ForeignKey,
     Index,
-    Integer,
     String,
 )
 
-from ..base import Base
+from ..base import Base, to_iso, utcnow
 
 
 class ProfileView(Base):
     __tablename__ = "profile_views"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, primary_key=True)
     viewer_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
@@ -29,7 +28,7 @@ class ProfileView(Base):
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
         nullable=False,
     )
-    viewed_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    viewed_at = Column(DateTime, server_default=utcnow(), nullable=False)
 
     __table_args__ = (
         Index("idx_profile_view_viewed", "viewed_id", "viewed_at"),
@@ -45,5 +44,5 @@ class ProfileView(Base):
             "id": self.id,
             "viewer_id": self.viewer_id,
             "viewed_id": self.viewed_id,
-            "viewed_at": self.viewed_at.isoformat() if self.viewed_at else None,
+            "viewed_at": to_iso(self.viewed_at),
         }
@@ -2,7 +2,6 @@
 Profile models for the Eigen platform.
 """
 
-import datetime
 from sqlalchemy import (
     Boolean,
     BigInteger,
@@ -14,18 +13,19 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 
-from ..base import Base
+from ..base import Base, to_iso, utcnow
 from .users import User
 
 
 class Profile(Base):
     __tablename__ = "profiles"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
@@ -61,20 +61,27 @@ class Profile(Base):
     resume_json = Column(JSONB, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
-    user = relationship("User", backref="profile")
+    user = relationship("User", back_populates="profile")
 
     __table_args__ = (
-        Index("idx_profile_user_id", "user_id"),
-        Index("idx_profile_github_user_id", "github_user_id"),
+        # Most profiles have no GitHub link; only index (and dedupe) the linked ones
+        Index(
+            "idx_profile_github_user_id",
+            "github_user_id",
+            unique=True,
+            postgresql_where=text("github_user_id IS NOT NULL"),
+        ),
+        Index("idx_profile_skills_gin", "skills", postgresql_using="gin"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self) -> str:
         return f"<Profile(id={self.id}, user_id='{self.user_id}')>"
@@ -97,11 +104,11 @@ class Profile(Base):
             "github_connected": self.github_connected,
             "github_username": self.github_username,
             "github_user_id": self.github_user_id,
-            "github_last_synced": self.github_last_synced.isoformat() if self.github_last_synced else None,
+            "github_last_synced": to_iso(self.github_last_synced),
             "resume_uploaded": self.resume_uploaded,
             "resume_file_url": self.resume_file_url,
             "resume_text": self.resume_text,
             "resume_json": self.resume_json,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": to_iso(self.created_at),
+            "updated_at": to_iso(self.updated_at),
         }
@@ -5,7 +5,6 @@ This module contains models for storing Expo push notification tokens
 for mobile devices.
 """
 
-import datetime
 from sqlalchemy import (
     Boolean,
     Column,
@@ -17,7 +16,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import relationship
 
-from ..base import Base
+from ..base import Base, utcnow
 
 
 class PushToken(Base):
@@ -41,13 +40,12 @@ class PushToken(Base):
 
     __tablename__ = "push_tokens"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
 
     user_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="User who owns this push token"
     )
 
@@ -75,21 +73,20 @@ class PushToken(Base):
         Boolean,
         default=True,
         nullable=False,
-        index=True,
         comment="Whether this token is currently active"
     )
 
     # Timestamps
     created_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
+        server_default=utcnow(),
         nullable=False
     )
 
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False
     )
 
@@ -103,27 +100,34 @@ class PushToken(Base):
     user = relationship(
         "User",
         foreign_keys=[user_id],
-        backref="push_tokens"
+        back_populates="push_tokens",
     )
 
     __table_args__ = (
-        Index("idx_push_token_user_active", "user_id", "is_active"),
+        # Notification sends read these per user; carry them in the index so
+        # the lookup never touches the heap
+        Index(
+            "idx_push_token_user_active",
+            "user_id",
+            "is_active",
+            postgresql_include=["token", "device_type", "last_used_at"],
+        ),
         {"comment": "Expo push notification tokens for mobile devices"},
     )
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Serialized by Base.to_dict(), in this order
+    __to_dict_fields__ = (
+        "id",
+        "user_id",
+        "token",
+        "device_type",
+        "device_name",
+        "is_active",
+        "created_at",
+        "updated_at",
+        "last_used_at",
+    )
 
     def __repr__(self) -> str:
         return f"<PushToken(id={self.id}, user_id='{self.user_id}', device='{self.device_type}')>"
-
-    def to_dict(self) -> dict:
-        """Convert push token to dictionary for API responses."""
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "token": self.token,
-            "device_type": self.device_type,
-            "device_name": self.device_name,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "last_used_at": self.last_used_at.isoformat() if self.last_used_at else None,
-        }
@@ -2,7 +2,6 @@
 User subscription model for the Eigen platform.
 """
 
-import datetime
 from enum import Enum
 from sqlalchemy import (
     Column,
@@ -12,10 +11,11 @@ from sqlalchemy import (
     Integer,
     String,
     Enum as SQLEnum,
+    text,
 )
 from sqlalchemy.orm import relationship
 
-from ..base import Base
+from ..base import Base, utcnow
 
 
 class SubscriptionTier(str, Enum):
@@ -31,10 +31,14 @@ class SubscriptionStatus(str, Enum):
     EXPIRED = "expired"
 
 
+# Statuses under which a Pro subscription grants access
+_PRO_STATUSES = frozenset({SubscriptionStatus.ACTIVE, SubscriptionStatus.TRIALING})
+
+
 class UserSubscription(Base):
     __tablename__ = "user_subscriptions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(
         String(255),
         ForeignKey("users.clerk_user_id", ondelete="CASCADE"),
@@ -59,45 +63,50 @@ class UserSubscription(Base):
     current_period_start = Column(DateTime, nullable=True)
     current_period_end = Column(DateTime, nullable=True)
     canceled_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
-    user = relationship("User", backref="subscription")
+    user = relationship("User", back_populates="subscription")
 
     __table_args__ = (
-        Index("idx_subscription_polar_id", "polar_subscription_id"),
         Index("idx_subscription_tier_status", "tier", "status"),
+        # Renewal/expiry scans only look at Pro subscriptions. The enum
+        # stores member names, hence 'PRO'
+        Index(
+            "idx_sub_status_period_end",
+            "status",
+            "current_period_end",
+            postgresql_where=text("tier = 'PRO'"),
+        ),
         {"comment": "User subscription tracking for Polar.sh integration"},
     )
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Serialized by Base.to_dict(), in this order
+    __to_dict_fields__ = (
+        "id",
+        "user_id",
+        "tier",
+        "status",
+        "polar_subscription_id",
+        "polar_customer_id",
+        "polar_product_id",
+        "billing_interval",
+        "current_period_start",
+        "current_period_end",
+        "canceled_at",
+        "created_at",
+        "updated_at",
+    )
 
     def __repr__(self) -> str:
         return f"<UserSubscription(user_id='{self.user_id}', tier='{self.tier}', status='{self.status}')>"
 
     @property
     def is_pro(self) -> bool:
-        return self.tier == SubscriptionTier.PRO and self.status in (
-            SubscriptionStatus.ACTIVE,
-            SubscriptionStatus.TRIALING,
-        )
-
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "tier": self.tier.value if self.tier else None,
-            "status": self.status.value if self.status else None,
-            "polar_subscription_id": self.polar_subscription_id,
-            "polar_customer_id": self.polar_customer_id,
-            "polar_product_id": self.polar_product_id,
-            "billing_interval": self.billing_interval,
-            "current_period_start": self.current_period_start.isoformat() if self.current_period_start else None,
-            "current_period_end": self.current_period_end.isoformat() if self.current_period_end else None,
-            "canceled_at": self.canceled_at.isoformat() if self.canceled_at else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        return self.tier == SubscriptionTier.PRO and self.status in _PRO_STATUSES
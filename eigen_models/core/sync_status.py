@@ -2,7 +2,6 @@
 Embedding sync status models for the Eigen platform.
 """
 
-import datetime
 from sqlalchemy import (
     Boolean,
     Column,
@@ -14,13 +13,13 @@ from sqlalchemy import (
     UniqueConstraint,
 )
 
-from ..base import Base
+from ..base import Base, utcnow
 
 
 class EmbeddingSyncStatus(Base):
     __tablename__ = "embedding_sync_status"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     entity_type = Column(String(50), nullable=False)
     entity_id = Column(String(255), nullable=False)
     qdrant_synced = Column(Boolean, default=False, nullable=False)
@@ -29,29 +28,29 @@ class EmbeddingSyncStatus(Base):
     last_synced_at = Column(DateTime, nullable=True)
     last_error = Column(Text, nullable=True)
     retry_count = Column(Integer, default=0)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
     __table_args__ = (
         UniqueConstraint("entity_type", "entity_id", name="uq_sync_entity"),
         Index("idx_sync_pending", "qdrant_synced", "neo4j_synced"),
-        Index("idx_sync_entity_type", "entity_type"),
     )
+    __mapper_args__ = {"eager_defaults": True}
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "entity_type": self.entity_type,
-            "entity_id": self.entity_id,
-            "qdrant_synced": self.qdrant_synced,
-            "qdrant_collection": self.qdrant_collection,
-            "neo4j_synced": self.neo4j_synced,
-            "last_synced_at": self.last_synced_at.isoformat() if self.last_synced_at else None,
-            "last_error": self.last_error,
-            "retry_count": self.retry_count,
-        }
+    # Serialized by Base.to_dict(), in this order
+    __to_dict_fields__ = (
+        "id",
+        "entity_type",
+        "entity_id",
+        "qdrant_synced",
+        "qdrant_collection",
+        "neo4j_synced",
+        "last_synced_at",
+        "last_error",
+        "retry_count",
+    )
@@ -2,7 +2,6 @@
 User model for the Eigen platform.
 """
 
-import datetime
 from sqlalchemy import (
     Boolean,
     Column,
@@ -10,9 +9,9 @@ from sqlalchemy import (
     Index,
     String,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
 
-from ..base import Base
+from ..base import Base, utcnow
 
 
 class User(Base):
@@ -23,11 +22,11 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=False, index=True)
     is_active = Column(Boolean, default=True, nullable=False)
     last_login_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     updated_at = Column(
         DateTime,
-        default=datetime.datetime.utcnow,
-        onupdate=datetime.datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
     mobile_number = Column(String(255), nullable=True)
@@ -48,23 +47,75 @@ class User(Base):
         foreign_keys="CofounderMatch.receiver_id",
     )
 
+    # Profile and account relationships. profile and subscription stay
+    # lists, as the backrefs they replaced were, although user_id is unique
+    profile = relationship("Profile", back_populates="user")
+    subscription = relationship("UserSubscription", back_populates="user")
+    push_tokens = relationship(
+        "PushToken",
+        back_populates="user",
+        foreign_keys="PushToken.user_id",
+    )
+    github_accounts = relationship("GitHubAccount", back_populates="user")
+    repositories = relationship("GitHubRepository", back_populates="user")
+
+    # Chat relationships
+    created_chats = relationship(
+        "Chat",
+        back_populates="creator",
+        foreign_keys="Chat.created_by",
+    )
+    messages = relationship("Message", back_populates="sender")
+
+    # Notification relationships
+    notifications_received = relationship(
+        "Notification",
+        back_populates="recipient",
+        foreign_keys="Notification.recipient_id",
+    )
+    notifications_triggered = relationship(
+        "Notification",
+        back_populates="actor",
+        foreign_keys="Notification.actor_id",
+    )
+
+    # fillfactor=90 for HOT updates is set by migration; create_all omits it
     __table_args__ = (
         Index("idx_user_email_active", "email", "is_active"),
         {"comment": "System users with Clerk authentication integration"},
     )
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Serialized by Base.to_dict(), in this order
+    __to_dict_fields__ = (
+        "clerk_user_id",
+        "name",
+        "email",
+        "is_active",
+        "last_login_at",
+        "mobile_number",
+        "image_url",
+        "created_at",
+        "updated_at",
+    )
+
+    @classmethod
+    def default_loading_options(cls) -> list:
+        """
+        Loader options for endpoints that list users with their details.
+
+        Apply as ``select(User).options(*User.default_loading_options())`` so a
+        page of users loads each of these relationships with one ``IN`` query
+        instead of one lazy SELECT per user. They stay lazy at the mapper level
+        so queries that don't need them (counts, id lookups, bulk reads) pay
+        nothing.
+        """
+        return [
+            selectinload(cls.profile),
+            selectinload(cls.cofounder_profile),
+            selectinload(cls.subscription),
+            selectinload(cls.push_tokens),
+        ]
 
     def __repr__(self) -> str:
         return f"<User(clerk_user_id='{self.clerk_user_id}', email='{self.email}')>"
-
-    def to_dict(self) -> dict:
-        return {
-            "clerk_user_id": self.clerk_user_id,
-            "name": self.name,
-            "email": self.email,
-            "is_active": self.is_active,
-            "last_login_at": self.last_login_at.isoformat() if self.last_login_at else None,
-            "mobile_number": self.mobile_number,
-            "image_url": self.image_url,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
@@ -5,19 +5,43 @@ This module contains utility functions for database operations,
 connection management, and common database patterns.
 """
 
-from typing import Optional
-from sqlalchemy import create_engine
+from typing import Iterator, Optional
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
 from ..base import Base
 
+# Applied to every new SQLite connection. WAL lets readers run alongside a
+# writer, and synchronous=NORMAL is safe in WAL mode for dev/test/embedded use
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 def create_database_engine(
     database_url: str,
     echo: bool = False,
     pool_size: int = 5,
     max_overflow: int = 10,
+    pool_recycle: int = 300,
+    pool_use_lifo: bool = True,
+    query_cache_size: int = 1200,
+    insertmanyvalues_page_size: int = 1000,
     **kwargs
 ):
     """
@@ -28,6 +52,14 @@ def create_database_engine(
         echo: Whether to echo SQL queries (for debugging)
         pool_size: Size of the connection pool
         max_overflow: Maximum number of connections that can overflow the pool
+        pool_recycle: Seconds after which a pooled connection is replaced, so
+            connections dropped by proxies or idle timeouts are never handed out
+        pool_use_lifo: Reuse the most recently returned connection first, letting
+            surplus connections go idle and be recycled
+        query_cache_size: Size of the compiled SQL statement cache (SQLAlchemy
+            defaults to 500, which the model set outgrows)
+        insertmanyvalues_page_size: Rows per multi-row INSERT when the ORM
+            batches an executemany (e.g. bulk push token or sync status inserts)
         **kwargs: Additional engine configuration
     
     Returns:
@@ -36,6 +68,8 @@ def create_database_engine(
     engine_kwargs = {
         "echo": echo,
         "pool_pre_ping": True,
+        "query_cache_size": query_cache_size,
+        "insertmanyvalues_page_size": insertmanyvalues_page_size,
         **kwargs
     }
     
@@ -44,23 +78,33 @@ def create_database_engine(
         engine_kwargs.update({
             "pool_size": pool_size,
             "max_overflow": max_overflow,
+            "pool_recycle": pool_recycle,
+            "pool_use_lifo": pool_use_lifo,
         })
     else:
         # SQLite-specific configuration
-        engine_kwargs.update({
-            "poolclass": StaticPool,
-            "connect_args": {"check_same_thread": False},
-        })
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+        if make_url(database_url).database in (None, "", ":memory:"):
+            # An in-memory database lives only as long as its one connection
+            engine_kwargs["poolclass"] = StaticPool
     
-    return create_engine(database_url, **engine_kwargs)
+    engine = create_engine(database_url, **engine_kwargs)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
 
 
-def create_session_factory(engine):
+def create_session_factory(engine, expire_on_commit: bool = True):
     """
     Create a SQLAlchemy session factory.
     
     Args:
         engine: SQLAlchemy Engine instance
+        expire_on_commit: Whether commit() expires loaded objects. Hot paths
+            such as batch jobs that commit periodically, or handlers calling
+            to_dict() after commit, can pass False to skip re-SELECTing
+            objects they already hold, at the cost of not seeing values the
+            database changed (triggers, defaults) since they were loaded
     
     Returns:
         SQLAlchemy sessionmaker factory
@@ -68,6 +112,7 @@ def create_session_factory(engine):
     return sessionmaker(
         autocommit=False,
         autoflush=False,
+        expire_on_commit=expire_on_commit,
         bind=engine
     )
 
@@ -85,6 +130,47 @@ def get_database_session(session_factory) -> Session:
     return session_factory()
 
 
+def stream_query(session: Session, stmt, batch: int = 1000) -> Iterator[list]:
+    """
+    Execute a select and yield its rows in batches of at most ``batch``.
+    
+    Uses ``yield_per``, which streams from a server-side cursor, so memory
+    stays proportional to the batch size rather than the result size. Useful
+    for full scans such as walking embedding_sync_status.
+    
+    Args:
+        session: SQLAlchemy Session instance
+        stmt: Select statement to execute
+        batch: Number of rows fetched and yielded at a time
+    
+    Yields:
+        Lists of result rows
+    """
+    result = session.execute(stmt.execution_options(yield_per=batch))
+    for partition in result.partitions():
+        yield partition
+
+
+def bulk_insert(session: Session, model, rows: list) -> None:
+    """
+    Insert many rows of ``model`` with a single executemany.
+    
+    Every row shares one ``INSERT`` statement, which is compiled once and
+    then served from the engine's compiled cache on later calls, and the
+    parameter sets are sent in multi-row batches of
+    ``insertmanyvalues_page_size``. Suited to high-frequency writers such as
+    push token registration, where one ``session.add()`` per row would
+    compile and flush each insert on its own.
+    
+    Args:
+        session: SQLAlchemy Session instance
+        model: Mapped model class to insert into
+        rows: List of dictionaries keyed by attribute name
+    """
+    if rows:
+        session.execute(insert(model), rows)
+
+
 def create_all_tables(engine):
     """
     Create all tables defined in the Eigen models.
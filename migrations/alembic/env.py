@@ -2,7 +2,7 @@ import os
 from logging.config import fileConfig
 
 from dotenv import load_dotenv
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, pool, text
 
 from alembic import context
 
@@ -13,17 +13,13 @@ if env_name == 'prod':
 else:
     env_file = '../.env.dev'
 
-# Try to load the environment-specific file first
-# The path is relative to the migrations directory where alembic runs
-if os.path.exists(env_file):
-    load_dotenv(env_file)
-else:
-    # Fall back to .env for backwards compatibility
-    # Check both in migrations dir and parent dir
-    if os.path.exists('../.env'):
-        load_dotenv('../.env')
-    else:
-        load_dotenv()
+# Load the environment-specific file, falling back to .env for backwards
+# compatibility. Paths are relative to the migrations directory where alembic
+# runs; if neither exists, python-dotenv searches for a .env itself
+dotenv_path = next(
+    (path for path in (env_file, '../.env') if os.path.exists(path)), None
+)
+load_dotenv(dotenv_path)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -48,12 +44,36 @@ if config.config_file_name is not None:
 
 # Add project root to Python path to ensure eigen_models can be imported
 import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from eigen_models import Base
 
 target_metadata = Base.metadata
 
+# Objects created by the PostGIS extension in the public schema. They are not
+# part of our metadata, so autogenerate would otherwise propose dropping them
+POSTGIS_SYSTEM_TABLES = frozenset({
+    "spatial_ref_sys",
+    "geometry_columns",
+    "geography_columns",
+    "raster_columns",
+    "raster_overviews",
+})
+
+
+# Session-level advisory lock held while online migrations run, so deploys
+# that start several instances at once apply each revision exactly once
+MIGRATION_LOCK_KEY = 0x656967656E  # "eigen"
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip reflected PostGIS system tables during autogenerate."""
+    return not (
+        type_ == "table" and reflected and name in POSTGIS_SYSTEM_TABLES
+    )
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -96,16 +116,47 @@ def run_migrations_online() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        # Label the session in pg_stat_activity
+        connect_args={"application_name": "alembic"},
     )
 
     with connectable.connect() as connection:
+        use_lock = connection.dialect.name == "postgresql"
+        if use_lock:
+            # Lift any role-level statement_timeout so long index builds are
+            # not cancelled midway. Set here rather than as a startup option,
+            # which transaction-mode poolers (PgBouncer, Neon, Supabase) reject
+            connection.execute(text("SET statement_timeout = 0"))
+            # Blocks until any other migrator finishes; the lock outlives the
+            # per-revision commits because it is held by the session
+            connection.execute(
+                text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+            )
+            connection.commit()
+
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
+            compare_type=True,
+            compare_server_default=False,
+            include_object=include_object,
+            # Commit after each revision so a failure mid-upgrade keeps the
+            # revisions already applied, and long upgrades don't hold locks
+            # from early migrations until the very end
+            transaction_per_migration=True,
         )
 
-        with context.begin_transaction():
-            context.run_migrations()
+        try:
+            with context.begin_transaction():
+                context.run_migrations()
+        finally:
+            if use_lock:
+                connection.rollback()
+                connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": MIGRATION_LOCK_KEY},
+                )
+                connection.commit()
 
 
 if context.is_offline_mode():
@@ -361,92 +361,26 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_index(op.f('ix_messages_sender_id'), table_name='messages')
-    op.drop_index(op.f('ix_messages_id'), table_name='messages')
-    op.drop_index(op.f('ix_messages_created_at'), table_name='messages')
-    op.drop_index(op.f('ix_messages_chat_id'), table_name='messages')
-    op.drop_index('idx_message_sender_id', table_name='messages')
-    op.drop_index('idx_message_created_at', table_name='messages')
-    op.drop_index('idx_message_chat_id', table_name='messages')
-    op.drop_index('idx_message_chat_created_at', table_name='messages')
     op.drop_table('messages')
-    op.drop_index(op.f('ix_user_subscriptions_user_id'), table_name='user_subscriptions')
-    op.drop_index(op.f('ix_user_subscriptions_id'), table_name='user_subscriptions')
-    op.drop_index('idx_subscription_tier_status', table_name='user_subscriptions')
-    op.drop_index('idx_subscription_polar_id', table_name='user_subscriptions')
     op.drop_table('user_subscriptions')
-    op.drop_index(op.f('ix_user_interactions_id'), table_name='user_interactions')
-    op.drop_index('idx_user_interaction_user', table_name='user_interactions')
-    op.drop_index('idx_user_interaction_type', table_name='user_interactions')
-    op.drop_index('idx_user_interaction_target', table_name='user_interactions')
     op.drop_table('user_interactions')
-    op.drop_index(op.f('ix_user_follows_id'), table_name='user_follows')
-    op.drop_index('idx_following', table_name='user_follows')
-    op.drop_index('idx_follower', table_name='user_follows')
     op.drop_table('user_follows')
-    op.drop_index(op.f('ix_push_tokens_user_id'), table_name='push_tokens')
-    op.drop_index(op.f('ix_push_tokens_token'), table_name='push_tokens')
-    op.drop_index(op.f('ix_push_tokens_is_active'), table_name='push_tokens')
-    op.drop_index(op.f('ix_push_tokens_id'), table_name='push_tokens')
-    op.drop_index('idx_push_token_user_active', table_name='push_tokens')
     op.drop_table('push_tokens')
-    op.drop_index(op.f('ix_profiles_user_id'), table_name='profiles')
-    op.drop_index(op.f('ix_profiles_id'), table_name='profiles')
-    op.drop_index('idx_profile_user_id', table_name='profiles')
-    op.drop_index('idx_profile_github_user_id', table_name='profiles')
     op.drop_table('profiles')
-    op.drop_index(op.f('ix_profile_views_id'), table_name='profile_views')
-    op.drop_index('idx_profile_view_viewer', table_name='profile_views')
-    op.drop_index('idx_profile_view_viewed', table_name='profile_views')
     op.drop_table('profile_views')
-    op.drop_index(op.f('ix_notifications_recipient_id'), table_name='notifications')
-    op.drop_index(op.f('ix_notifications_notification_type'), table_name='notifications')
-    op.drop_index(op.f('ix_notifications_is_read'), table_name='notifications')
-    op.drop_index(op.f('ix_notifications_id'), table_name='notifications')
-    op.drop_index(op.f('ix_notifications_created_at'), table_name='notifications')
-    op.drop_index(op.f('ix_notifications_actor_id'), table_name='notifications')
-    op.drop_index('idx_notification_type_created', table_name='notifications')
-    op.drop_index('idx_notification_recipient_unread', table_name='notifications')
-    op.drop_index('idx_notification_recipient_created', table_name='notifications')
     op.drop_table('notifications')
-    op.drop_index(op.f('ix_github_repositories_user_id'), table_name='github_repositories')
-    op.drop_index(op.f('ix_github_repositories_id'), table_name='github_repositories')
-    op.drop_index(op.f('ix_github_repositories_github_repo_id'), table_name='github_repositories')
-    op.drop_index('idx_github_repo_user_id', table_name='github_repositories')
-    op.drop_index('idx_github_repo_topics', table_name='github_repositories', postgresql_using='gin')
-    op.drop_index('idx_github_repo_languages', table_name='github_repositories', postgresql_using='gin')
     op.drop_table('github_repositories')
-    op.drop_index(op.f('ix_github_accounts_user_id'), table_name='github_accounts')
-    op.drop_index(op.f('ix_github_accounts_id'), table_name='github_accounts')
-    op.drop_index(op.f('ix_github_accounts_github_user_id'), table_name='github_accounts')
-    op.drop_index('idx_github_account_user_id', table_name='github_accounts')
-    op.drop_index('idx_github_account_github_user_id', table_name='github_accounts')
     op.drop_table('github_accounts')
-    op.drop_index(op.f('ix_cofounder_profiles_user_id'), table_name='cofounder_profiles')
-    op.drop_index(op.f('ix_cofounder_profiles_id'), table_name='cofounder_profiles')
-    op.drop_index('idx_cofounder_profile_visible', table_name='cofounder_profiles')
-    op.drop_index('idx_cofounder_profile_user_id', table_name='cofounder_profiles')
-    op.drop_index('idx_cofounder_profile_complete', table_name='cofounder_profiles')
     op.drop_table('cofounder_profiles')
-    op.drop_index(op.f('ix_cofounder_matches_status'), table_name='cofounder_matches')
-    op.drop_index(op.f('ix_cofounder_matches_sender_id'), table_name='cofounder_matches')
-    op.drop_index(op.f('ix_cofounder_matches_receiver_id'), table_name='cofounder_matches')
-    op.drop_index(op.f('ix_cofounder_matches_id'), table_name='cofounder_matches')
-    op.drop_index('idx_match_sender_status', table_name='cofounder_matches')
-    op.drop_index('idx_match_receiver_status', table_name='cofounder_matches')
-    op.drop_index('idx_match_created_at', table_name='cofounder_matches')
     op.drop_table('cofounder_matches')
-    op.drop_index(op.f('ix_chats_id'), table_name='chats')
-    op.drop_index(op.f('ix_chats_created_by'), table_name='chats')
-    op.drop_index('idx_chat_type', table_name='chats')
-    op.drop_index('idx_chat_last_message_at', table_name='chats')
-    op.drop_index('idx_chat_created_by', table_name='chats')
     op.drop_table('chats')
-    op.drop_index(op.f('ix_users_email'), table_name='users')
-    op.drop_index('idx_user_email_active', table_name='users')
     op.drop_table('users')
-    op.drop_index(op.f('ix_embedding_sync_status_id'), table_name='embedding_sync_status')
-    op.drop_index('idx_sync_pending', table_name='embedding_sync_status')
-    op.drop_index('idx_sync_entity_type', table_name='embedding_sync_status')
     op.drop_table('embedding_sync_status')
+    # DROP TABLE removes each table's indexes, but not the enum types
+    for enum_name in (
+        'matchstatus', 'technicallevel', 'employmentstatus',
+        'commitmenttimeline', 'ideastatus', 'remotepreference',
+        'notificationtype', 'subscriptiontier', 'subscriptionstatus',
+    ):
+        op.execute(f'DROP TYPE IF EXISTS {enum_name}')
     # ### end Alembic commands ###
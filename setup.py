@@ -1,12 +1,19 @@
 """Setup configuration for eigen-models package."""
 
+from packaging.requirements import Requirement
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
 with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+    # Requirement() rejects malformed specifiers and normalizes environment
+    # markers; inline comments and pip options (-r, -c, ...) are skipped
+    requirements = [
+        str(Requirement(spec))
+        for spec in (line.split("#", 1)[0].strip() for line in fh)
+        if spec and not spec.startswith("-")
+    ]
 
 setup(
     name="eigen-models",    
@@ -34,6 +41,7 @@ setup(
     python_requires=">=3.9",
     install_requires=requirements,
     extras_require={
+        "orjson": ["orjson>=3.9.0"],
         "dev": [
             "black>=23.0.0",
             "flake8>=6.0.0",
@@ -0,0 +1,29 @@
+"""
+Tests for the native enum columns on chats and messages.
+"""
+
+from eigen_models import Chat, ChatType, Message, MessageType
+
+
+def test_chat_to_dict_accepts_plain_string_type():
+    chat = Chat(chat_type="direct", participant_ids=["a", "b"])
+
+    assert chat.to_dict()["chat_type"] == "direct"
+
+
+def test_chat_to_dict_accepts_enum_type():
+    chat = Chat(chat_type=ChatType.GROUP, participant_ids=["a"])
+
+    assert chat.to_dict()["chat_type"] == "group"
+
+
+def test_message_to_dict_accepts_plain_string_type():
+    message = Message(chat_id=1, message_type="image")
+
+    assert message.to_dict()["message_type"] == "image"
+
+
+def test_message_to_dict_accepts_enum_type():
+    message = Message(chat_id=1, message_type=MessageType.TEXT)
+
+    assert message.to_dict()["message_type"] == "text"
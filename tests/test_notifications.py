@@ -0,0 +1,61 @@
+"""
+Tests for Notification.is_read, which is derived from read_at.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql
+
+from eigen_models import Notification
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_setting_is_read_stamps_a_python_datetime():
+    notification = Notification(is_read=True)
+
+    assert isinstance(notification.read_at, datetime)
+    assert notification.is_read is True
+    assert notification.to_dict()["read_at"] == notification.read_at.isoformat()
+
+
+def test_clearing_is_read_clears_read_at():
+    notification = Notification(read_at=datetime(2025, 1, 1))
+    notification.is_read = False
+
+    assert notification.read_at is None
+    assert notification.is_read is False
+
+
+def test_unread_filter_matches_partial_index_predicate():
+    for criterion in (
+        Notification.is_read == False,  # noqa: E712
+        Notification.is_read.is_(False),
+        ~Notification.is_read,
+    ):
+        sql = _sql(select(Notification.id).where(criterion))
+        assert "WHERE notifications.read_at IS NULL" in sql
+
+
+def test_read_filter_renders_is_not_null():
+    sql = _sql(select(Notification.id).where(Notification.is_read == True))  # noqa: E712
+
+    assert "WHERE notifications.read_at IS NOT NULL" in sql
+
+
+def test_bulk_update_marking_read_sets_read_at():
+    sql = _sql(update(Notification).values(is_read=True))
+
+    assert sql.startswith(
+        "UPDATE notifications SET "
+        "read_at=coalesce(notifications.read_at, timezone('utc', now()))"
+    )
+
+
+def test_bulk_update_marking_unread_clears_read_at():
+    sql = _sql(update(Notification).values(is_read=False))
+
+    assert sql == "UPDATE notifications SET read_at=NULL"